@@ -7,9 +7,14 @@ from ._load_vocab import vocab, matcher
 
 # ~~~ Type aliases ~~~
 
-SentenceSpan = Tuple[int,int]
 Bigram = Tuple[str,str]
 
+# ~~~ Vocab lookups ~~~
+
+FUNC_WORDS = frozenset(vocab.get("func_words"))
+PUNCTUATION = frozenset(vocab.get("punctuation"))
+LETTERS = frozenset(vocab.get("letters"))
+
 # ~~~ Getters ~~~
 
 def get_tokens(doc):
@@ -19,39 +24,31 @@ def get_pos_tags(doc):
     return [token.pos_ for token in doc]
 
 def get_dep_labels(doc):
-    return [dep for token in doc for dep in token.dep_]
+    return [token.dep_ for token in doc]
 
 def get_morph_tags(doc):
     return [morph for token in doc for morph in token.morph if morph != ""]
 
 def get_pos_bigrams(doc) -> List[Bigram]:
 
-    def get_sentence_spans(doc) -> List[SentenceSpan]:
-        """Gets each start and end index of all sentences in a document"""
-        return [(sent.start, sent.end) for sent in doc.sents]
-
-    def insert_sentence_boundaries(spans:List[SentenceSpan]) -> List[str]:
+    def insert_sentence_boundaries(doc) -> List[str]:
         """Marks sentence boundaries with symbols BOS (beginning of sentence) & EOS (end of sentence)"""
+        pos_tags = doc._.pos_tags
         new_tokens = []
-        for i, pos in enumerate(doc._.pos_tags):
-            for sent_start, sent_end in spans:
-                if i == sent_start:
-                    new_tokens.append("BOS")
-                elif i == sent_end:
-                    new_tokens.append("EOS")
-            new_tokens.append(pos)
-        new_tokens.append("EOS")
+        for sent in doc.sents:
+            new_tokens.append("BOS")
+            new_tokens.extend(pos_tags[sent.start:sent.end])
+            new_tokens.append("EOS")
         return new_tokens
 
     def convert_bigrams_to_strings(bigrams) -> List[str]:
         """Converts bigrams into a list of bigram strings"""
         return [" ".join(bigram) for bigram in bigrams]
 
-    def bigrams(iter:Iterable) -> List[Tuple]:
-        return [tuple(iter[i:i+2]) for i in range(len(iter)-1)]
+    def bigrams(iter:List[str]) -> Iterable[Bigram]:
+        return zip(iter, iter[1:])
 
-    sent_spans = get_sentence_spans(doc)
-    pos_tags_with_boundary_syms = insert_sentence_boundaries(sent_spans)
+    pos_tags_with_boundary_syms = insert_sentence_boundaries(doc)
     pos_bigrams = bigrams(pos_tags_with_boundary_syms)
     return convert_bigrams_to_strings(pos_bigrams)
 
@@ -60,16 +57,13 @@ def get_sentences(doc):
     return [match.pattern_name for match in sentence_matches]
 
 def get_func_words(doc):
-    func_words_vocab = vocab.get("func_words")
-    return [token for token in doc.doc._.tokens if token in func_words_vocab]
+    return [token for token in doc.doc._.tokens if token in FUNC_WORDS]
 
 def get_punctuation(doc):
-    punctuation_vocab = vocab.get("punctuation")
-    return [punc for token in doc.doc._.tokens for punc in token if punc in punctuation_vocab]
+    return [punc for punc in doc.text if punc in PUNCTUATION]
 
 def get_letters(doc):
-    letters_vocab = vocab.get("letters")
-    return [letter for token in doc.doc._.tokens for letter in token if letter in letters_vocab]
+    return [letter for letter in doc.text if letter in LETTERS]
 
 
 
@@ -103,8 +97,8 @@ except OSError:
     print(f"Downloading spaCy language model '{model}' (this will only happen once)", file=stderr)
     from spacy.cli import download
     download(model)
+    nlp = spacy.load(model, exclude=["ner"])
 
-nlp = spacy.load(model, exclude=["ner"])
 nlp.max_length = 4000000
 print(f"Gram2Vec: Using '{model}'")
 
@@ -13,7 +13,7 @@ class Vocab:
     def _load_from_txt(self, path:str) -> Tuple[str]:
         """Loads a .txt file delimited by newlines"""
         with open (path, "r") as fin:
-            return [line.strip("\n") for line in fin.readlines()]
+            return tuple(line.strip("\n") for line in fin)
 
     def _get_user_vocab_path(self):
         """Gets the user's path to the vocabulary files"""
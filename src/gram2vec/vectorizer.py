@@ -2,11 +2,14 @@
 from collections import Counter
 import demoji
 import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Tuple, List, Dict, Callable, Optional, Iterable
 
+from spacy.attrs import POS, DEP
 from ._load_spacy import nlp, Doc
 from ._load_vocab import vocab
 
@@ -27,10 +30,17 @@ def measure_time(func):
 class Document:
     """
     Encapsulates the raw text and spacy doc. Needed because emojis must be taken out of the spacy doc before 
-    the dependency parse, but the emojis feature still needs access to the emojis from the text
+    the dependency parse, but the emojis feature still needs access to the emojis from the text. The emojis
+    are extracted once when the document is processed
     """
     raw:str
     doc:Doc
+    emojis:List[str]
+    
+    @cached_property
+    def char_counts(self) -> Counter:
+        """Counts every character of the parsed text once, shared by the character level features"""
+        return Counter(self.doc.text)
     
 REGISTERD_FEATURES = {}
 
@@ -41,10 +51,18 @@ class Feature:
         self.name = func.__name__
         
     def __call__(self, doc, vocab):
+        normalized_counts = pd.Series(self.vectorize(doc, vocab), index=vocab)
+        return self._prefix_feature_names(normalized_counts)
+    
+    def vectorize(self, doc, vocab) -> np.ndarray:
+        """Counts and normalizes the features of a document in vocab order, without attaching feature names"""
         counted_features = self.func(doc)
         all_counts = self._include_zero_vocab_counts(counted_features, vocab)
-        normalized_counts = self._normalize(all_counts)
-        return self._prefix_feature_names(normalized_counts)
+        return self._normalize(all_counts)
+    
+    def feature_names(self, vocab:Tuple[str]) -> List[str]:
+        """Gets the prefixed feature names for a vocab, in the same order as vectorize()"""
+        return [f"{self.name}:{feature}" for feature in vocab]
     
     @classmethod
     def register(cls, func):
@@ -53,22 +71,16 @@ class Feature:
         REGISTERD_FEATURES[func.name] = func
         return func
 
-    def _include_zero_vocab_counts(self, counted_features:Counter, vocab:Tuple[str]) -> pd.Series:
+    def _include_zero_vocab_counts(self, counted_features:Counter, vocab:Tuple[str]) -> np.ndarray:
         """Includes the vocabulary items that were not counted in the document (to ensure the same size vector for all documents)"""
-        count_dict = {}
-        for feature in vocab:
-            if feature in counted_features:
-                count = counted_features[feature] 
-            else:
-                count = 0
-            count_dict[feature] = count
-        return pd.Series(count_dict)
+        return np.array([counted_features[feature] for feature in vocab])
     
-    def _get_sum(self, counts:pd.Series) -> int:
+    def _get_sum(self, counts:np.ndarray) -> int:
         """Gets sum of counts. Accounts for possible zero counts"""
-        return sum(counts) if sum(counts) > 0 else 1
+        total = counts.sum()
+        return total if total > 0 else 1
 
-    def _normalize(self, counts:pd.Series) -> pd.Series:
+    def _normalize(self, counts:np.ndarray) -> np.ndarray:
         """Normalizes each count by the sum of counts for that feature"""
         return counts / self._get_sum(counts)
     
@@ -79,9 +91,14 @@ class Feature:
         """
         return features.add_prefix(f"{self.name}:")
         
+def _count_attribute(doc:Doc, attr_id:int) -> Counter:
+    """Counts a token attribute with spaCy's Doc.count_by and maps the attribute ids back to their strings"""
+    strings = doc.vocab.strings
+    return Counter({strings[attr]: count for attr, count in doc.count_by(attr_id).items()})
+        
 @Feature.register
 def pos_unigrams(text:Document) -> Feature:
-    return Counter(text.doc._.pos_tags)
+    return _count_attribute(text.doc, POS)
     
 @Feature.register
 def pos_bigrams(text:Document) -> Feature:
@@ -93,15 +110,15 @@ def func_words(text:Document) -> Feature:
  
 @Feature.register
 def punctuation(text:Document) -> Feature:
-    return Counter(text.doc._.punctuation)
+    return text.char_counts
 
 @Feature.register
 def letters(text:Document) -> Feature:
-    return Counter(text.doc._.letters)
+    return text.char_counts
 
 @Feature.register
 def dep_labels(text:Document) -> Feature:
-    return Counter(text.doc._.dep_labels)
+    return _count_attribute(text.doc, DEP)
 
 @Feature.register
 def morph_tags(text:Document) -> Feature:
@@ -111,13 +128,13 @@ def morph_tags(text:Document) -> Feature:
 def sentences(text:Document) -> Feature:
     return Counter(text.doc._.sentences)
 
+EMOJIS = frozenset(vocab.get("emojis"))
+
 # emojis must get removed before processed through spaCy,
 # so spaCy extensions cannot be used here unfortunately
 @Feature.register
 def emojis(text:Document) -> Feature:
-    emojis_vocab = vocab.get("emojis")
-    extracted_emojis = demoji.findall_list(text.raw, desc=False)
-    return Counter([emoji for emoji in extracted_emojis if emoji in emojis_vocab])
+    return Counter([emoji for emoji in text.emojis if emoji in EMOJIS])
 
 # ~~~ Processing ~~~
 
@@ -148,17 +165,20 @@ def load_jsonlines(path:str) -> pd.DataFrame:
         dfs = [pd.read_json(file, lines=True) for file in Path(path).glob("*.jsonl")]
         return pd.concat(dfs).reset_index(drop=True)
     
-def _remove_emojis(document:str) -> str:
-    """Removes emojis from a string and fixes spacing issue caused by emoji removal"""
-    new_string = demoji.replace(document, "").split()
-    return " ".join(new_string)
+def _remove_emojis(document:str, emojis:List[str]) -> str:
+    """Removes emojis from a string and fixes spacing issue caused by emoji removal. Skips the removal when no emojis were found"""
+    if emojis:
+        document = demoji.replace(document, "")
+    return " ".join(document.split())
 
 def _process_documents(documents:Iterable[str]) -> List[Document]:
     """Converts all provided documents into Document instances, which encapsulates the raw text and spacy doc"""
-    nlp_docs = nlp.pipe([_remove_emojis(doc) for doc in documents])
+    documents = list(documents)
+    extracted_emojis = [demoji.findall_list(doc, desc=False) for doc in documents]
+    nlp_docs = nlp.pipe(_remove_emojis(doc, doc_emojis) for doc, doc_emojis in zip(documents, extracted_emojis))
     processed = []
-    for raw_text, nlp_doc in zip(documents, nlp_docs):
-        processed.append(Document(raw_text, nlp_doc))
+    for raw_text, nlp_doc, doc_emojis in zip(documents, nlp_docs, extracted_emojis):
+        processed.append(Document(raw_text, nlp_doc, doc_emojis))
     return processed
 
 def _get_json_entries(df) -> Tuple[pd.Series, pd.Series, pd.Series]:
@@ -172,31 +192,41 @@ def _get_json_entries(df) -> Tuple[pd.Series, pd.Series, pd.Series]:
     
     return documents, author_ids, document_ids
 
-def _content_embedding(doc:Document) -> pd.Series:
-    """Retrieves the spacy document embedding and returns it as a Series object"""
-    return pd.Series(doc.doc.vector).add_prefix("Embedding dim: ")
+def _content_embedding_names(doc:Document) -> List[str]:
+    """Gets the column names for the spacy document embedding dimensions"""
+    return [f"Embedding dim: {i}" for i in range(len(doc.doc.vector))]
     
-def _apply_features(doc:Document, config:Optional[Dict], include_content_embedding:bool) -> pd.Series:
-    """Applies all feature extractors to a given document, optionally adding the spaCy emedding vector"""
-    features = []
-    for feature in get_activated_features(config):
-        feature_vocab = vocab.get(feature.name)
-        extraction = feature(doc, feature_vocab)
-        features.append(extraction)
+def _get_feature_vocabs(config:Optional[Dict]) -> List[Tuple[Feature, Tuple[str]]]:
+    """Pairs each activated feature with its vocab. Resolved once per batch rather than once per document"""
+    return [(feature, vocab.get(feature.name)) for feature in get_activated_features(config)]
+    
+def _apply_features(doc:Document, 
+                    feature_vocabs:List[Tuple[Feature, Tuple[str]]], 
+                    include_content_embedding:bool,
+                    out:np.ndarray) -> None:
+    """Applies all feature extractors to a given document, optionally adding the spaCy emedding vector. Writes into the given row buffer"""
+    start = 0
+    for feature, feature_vocab in feature_vocabs:
+        end = start + len(feature_vocab)
+        out[start:end] = feature.vectorize(doc, feature_vocab)
+        start = end
         
     if include_content_embedding:
-        features.append(_content_embedding(doc))
-    return pd.concat(features, axis=0)
+        out[start:] = doc.doc.vector
 
 def _apply_features_to_docs(docs:List[Document],
                             config:Optional[Dict], 
                             include_content_embedding:bool) -> pd.DataFrame:
     """Applies the feature extractors to all documents and creates a style vector matrix"""
-    feature_vectors = []
-    for doc in docs:
-        vector = _apply_features(doc, config, include_content_embedding)
-        feature_vectors.append(vector)
-    return pd.concat(feature_vectors, axis=1).T
+    feature_vocabs = _get_feature_vocabs(config)
+    columns = [name for feature, feature_vocab in feature_vocabs for name in feature.feature_names(feature_vocab)]
+    if include_content_embedding and docs:
+        columns.extend(_content_embedding_names(docs[0]))
+        
+    matrix = np.empty((len(docs), len(columns)))
+    for i, doc in enumerate(docs):
+        _apply_features(doc, feature_vocabs, include_content_embedding, out=matrix[i])
+    return pd.DataFrame(matrix, columns=columns)
 
 def from_jsonlines(path:str, 
                    config:Optional[Dict]=None, 
@@ -3,6 +3,18 @@ import numpy as np
 from scipy.stats import zscore
 from typing import List
 
+NAME_MAPPING = {
+    "pos_unigrams" : "path of speech unigram",
+    "pos_bigrams" : "part of speech bigram",
+    "morph_tags" : "morphological tag",
+    "dep_labels" : "dependency parse label",
+    "func_words" : "function word",
+    "punctuation" : "punctuation mark",
+    "letters" : "letter",
+    "sentences" : "sentence type",
+    "emojis" : "emoji"
+}
+
 # code is messy and should be refactored
 class Verbalizer:
     """
@@ -18,21 +30,11 @@ class Verbalizer:
         """Excludes given columns from a dataframe. Used when doing numerical operations"""
         return df.loc[:, ~df.columns.isin(cols)]
     
-    def _get_author_docs(self, author_id:str) -> pd.DataFrame:
-        """Retrieves an authors documents from self.docs_df"""
-        return self.docs_df.loc[self.docs_df["authorIDs"] == author_id]
-
     def _make_author_df(self, docs_df:pd.DataFrame) -> pd.DataFrame:
         """Creates an author level dataframe. Each author entry is the average of that author's document vectors"""
-        author_ids = docs_df["authorIDs"].unique()
-        author_ids_to_avs = {}
-        
-        for author_id in author_ids:
-            author_doc_entries = self._get_author_docs(author_id)
-            author_doc_vectors = self._exclude_columns(author_doc_entries, cols=['documentID', 'authorIDs'])
-            author_ids_to_avs[author_id] = author_doc_vectors.mean(axis=0)
-
-        df = pd.DataFrame(author_ids_to_avs).T      
+        doc_vectors = self._exclude_columns(docs_df, cols=['documentID'])
+        df = doc_vectors.groupby("authorIDs", sort=False).mean()
+        df.index.name = None
         return df
     
     def _get_threshold_zscores_idxs(self, zscores:np.ndarray) -> List[int]:
@@ -65,19 +67,8 @@ class Verbalizer:
 
     def _template(self, doc_or_author:str, feat_name:str, direction:str) -> str:
         """Template for the zscore verbalizer"""
-        name_mapping = {
-            "pos_unigrams" : "path of speech unigram",
-            "pos_bigrams" : "part of speech bigram",
-            "morph_tags" : "morphological tag",
-            "dep_labels" : "dependency parse label",
-            "func_words" : "function word",
-            "punctuation" : "punctuation mark",
-            "letters" : "letter",
-            "sentences" : "sentence type",
-            "emojis" : "emoji"
-        }
         feature = feat_name.split(":")
-        return f"This {doc_or_author} uses the {name_mapping[feature[0]]} '{feature[1]}' {direction} than the average {doc_or_author}"
+        return f"This {doc_or_author} uses the {NAME_MAPPING[feature[0]]} '{feature[1]}' {direction} than the average {doc_or_author}"
     
     def _verbalize_zscores(self, zscores:pd.Series, to_verbalize:str) -> List[str]:
         """Creates a list of verbalized zscores"""